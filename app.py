@@ -4,10 +4,19 @@ ENERGY MODELING OPTIMIZER BY SJ
 Professional renewable energy optimization tool with BCG-style interface.
 """
 
+import dbm
+import io
+import math
+import os
+import pickle
+import shelve
+import threading
+import zipfile
+from types import MappingProxyType
+
 import streamlit as st
-import pandas as pd
 import numpy as np
-from datetime import datetime
+import xxhash
 
 # Page configuration
 st.set_page_config(
@@ -18,7 +27,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+_CSS = """
 <style>
     .main {
         background-color: #0E1117;
@@ -56,24 +65,6 @@ st.markdown("""
         font-weight: 600;
     }
     
-    .component-card {
-        background: linear-gradient(135deg, #1a472a 0%, #2d5a3d 100%);
-        border: 2px solid #00FF88;
-        border-radius: 15px;
-        padding: 20px;
-        margin: 10px 0;
-        box-shadow: 0 4px 20px rgba(0, 255, 136, 0.15);
-    }
-    
-    .component-card-disabled {
-        background: linear-gradient(135deg, #2a2a2a 0%, #3a3a3a 100%);
-        border: 2px solid #666;
-        border-radius: 15px;
-        padding: 20px;
-        margin: 10px 0;
-        opacity: 0.5;
-    }
-    
     .topology-box {
         background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
         border: 3px solid #00D9FF;
@@ -83,408 +74,626 @@ st.markdown("""
         text-align: center;
     }
     
-    .flow-arrow {
-        font-size: 40px;
-        color: #FFD700;
-        margin: 0 20px;
-    }
-    
-    .component-icon {
-        font-size: 60px;
-        margin: 10px;
+    .topology-box svg {
+        width: 100%;
+        height: auto;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Header and footer
+_HEADER_HTML = '<p class="big-font">⚡ ENERGY MODELING OPTIMIZER</p><p class="subtitle">BY SJ</p><hr>'
+_FOOTER_HTML = """
+<div style="text-align: center; color: #00D9FF; padding: 20px;">
+    <p style="font-size: 18px;"><b>⚡ Energy Modeling Optimizer v4.0 Professional</b></p>
+    <p style="font-size: 14px;">Developed by SJ | 2026</p>
+</div>
+"""
+
+@st.cache_resource
+def _inject_css():
+    """Emit the stylesheet; cache hits replay the element instead of rebuilding it."""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+_inject_css()
+
+# Topology layout: node -> (x, y, icon, name, colour), fixed at import
+_NODE_RADIUS = 38
+_NODES = {
+    'pv': (110, 65, '☀️', 'Solar PV', '#FFD700'),
+    'wind': (110, 195, '💨', 'Wind', '#00D9FF'),
+    'hydro': (110, 325, '💧', 'Hydro', '#1E90FF'),
+    'grid': (400, 195, '⚡', 'Electricity Grid', '#FFD700'),
+    'load': (690, 105, '🏭', 'Load Demand', '#FF6B6B'),
+    'bess': (690, 285, '🔋', 'BESS', '#00FF88'),
+}
+_FIXED_NODES = {'grid': (True, 'Distribution Hub'), 'load': (True, 'Consumer Load')}
+
+def _edge_segment(src_key, dst_key):
+    """Endpoints of an edge, trimmed so it starts and ends at the node circles."""
+    x0, y0 = _NODES[src_key][:2]
+    x1, y1 = _NODES[dst_key][:2]
+    length = math.hypot(x1 - x0, y1 - y0)
+    ux, uy = (x1 - x0) / length, (y1 - y0) / length
+    return (src_key, dst_key, x0 + ux * _NODE_RADIUS, y0 + uy * _NODE_RADIUS,
+            x1 - ux * (_NODE_RADIUS + 4), y1 - uy * (_NODE_RADIUS + 4))
+
+_EDGES = tuple(_edge_segment(*edge) for edge in (
+    ('pv', 'grid'), ('wind', 'grid'), ('hydro', 'grid'), ('grid', 'load'), ('grid', 'bess'),
+))
+
+_SVG_OPEN = (
+    '<svg viewBox="0 0 800 410" xmlns="http://www.w3.org/2000/svg" font-family="sans-serif">'
+    '<defs><marker id="arrow" viewBox="0 0 10 10" refX="9" refY="5" markerWidth="6" markerHeight="6" '
+    'orient="auto-start-reverse"><path d="M0,0 L10,5 L0,10 z" fill="#FFD700"/></marker></defs>'
+)
+
+# Topology (cached on primitives only: configs carry profile arrays that would bloat the key).
+# The SVG string is immutable, so cache_resource can hand it out without a pickle round trip.
+@st.cache_resource(max_entries=32, ttl=24 * 60 * 60, show_spinner=False)
+def topology_svg(pv, wind, hydro, bess):
+    """Draw the system topology as inline SVG; each source is an (enabled, caption) pair."""
+    state = {'pv': pv, 'wind': wind, 'hydro': hydro, 'bess': bess, **_FIXED_NODES}
+
+    parts = [_SVG_OPEN]
+    for src_key, dst_key, x0, y0, x1, y1 in _EDGES:
+        if state[src_key][0] and state[dst_key][0]:
+            style = 'stroke="#FFD700" marker-end="url(#arrow)"'
+            if dst_key == 'bess':
+                style += ' marker-start="url(#arrow)"'
+        else:
+            style = 'stroke="#555" stroke-dasharray="6 6"'
+        parts.append(f'<line x1="{x0:.1f}" y1="{y0:.1f}" x2="{x1:.1f}" y2="{y1:.1f}" stroke-width="3" {style}/>')
+    for key, (x, y, icon, name, color) in _NODES.items():
+        enabled, caption = state[key]
+        parts.append(
+            f'<g opacity="{1.0 if enabled else 0.4}">'
+            f'<title>{name}&#10;Status: {"Enabled" if enabled else "Disabled"}&#10;Capacity: {caption}</title>'
+            f'<circle cx="{x}" cy="{y}" r="{_NODE_RADIUS}" fill="{color if enabled else "#444"}" '
+            f'fill-opacity="0.25" stroke="{color if enabled else "#666"}" stroke-width="3"/>'
+            f'<text x="{x}" y="{y + 11}" font-size="32" text-anchor="middle">{icon}</text>'
+            f'<text x="{x}" y="{y + _NODE_RADIUS + 20}" font-size="15" font-weight="bold" fill="#FFFFFF" '
+            f'text-anchor="middle">{name}</text>'
+            f'<text x="{x}" y="{y + _NODE_RADIUS + 38}" font-size="13" fill="#CCCCCC" '
+            f'text-anchor="middle">{caption}</text>'
+            '</g>'
+        )
+    parts.append('</svg>')
+    return '<div class="topology-box">' + ''.join(parts) + '</div>'
+
+def component_status(cfg, lo_key='min', hi_key='max'):
+    """Caption a component with its capacity range, or 'Disabled'."""
+    return f"{cfg[lo_key]:.1f} - {cfg[hi_key]:.1f} MW" if cfg['enabled'] else 'Disabled'
+
+# Profiles (cached on an xxh3 digest of the upload; the underscored raw bytes are not hashed)
+@st.cache_data(show_spinner=False)
+def load_profile(digest, name, _file_bytes):
+    """Parse an uploaded CSV/XLSX profile into a float32 array of its first numeric column."""
+    import pandas as pd  # only needed once a profile is uploaded; keeps it off the cold start
+
+    buffer = io.BytesIO(_file_bytes)
+    try:
+        if name.lower().endswith('.csv'):
+            try:
+                # pyarrow ships with Streamlit; its multithreaded reader beats the C engine
+                frame = pd.read_csv(buffer, engine='pyarrow')
+            except ImportError:
+                buffer.seek(0)
+                frame = pd.read_csv(buffer, low_memory=False)
+        else:
+            frame = pd.read_excel(buffer)
+    except (ValueError, KeyError, zipfile.BadZipFile) as exc:
+        # Corrupt workbooks raise BadZipFile, non-workbook zips KeyError; report them like bad CSVs
+        raise ValueError(f"{name} is not a readable CSV/XLSX file") from exc
+    values = frame.select_dtypes('number')
+    if values.empty:
+        raise ValueError(f"{name} has no numeric column")
+    return np.ascontiguousarray(values.iloc[:, 0].to_numpy(), dtype=np.float32)
+
+def upload_profile(uploaded):
+    """Parse an UploadedFile through the profile cache."""
+    file_bytes = uploaded.getvalue()
+    return load_profile(xxhash.xxh3_64_hexdigest(file_bytes), uploaded.name, file_bytes)
+
+def read_profile(uploaded, saved=None):
+    """Return the uploaded profile as an array, falling back to the saved one."""
+    if uploaded is None:
+        if saved is not None:
+            st.info(f"ℹ️ Using saved profile ({saved.size:,} values)")
+        return saved
+    try:
+        profile = upload_profile(uploaded)
+    except ValueError as exc:
+        st.error(f"❌ Could not read {uploaded.name}: {exc}")
+        return saved
+    st.success(f"✅ Loaded: {uploaded.name} ({profile.size:,} values)")
+    return profile
 
 # Session State
-if 'pv_config' not in st.session_state:
-    st.session_state.pv_config = {
+_SESSION_DEFAULTS = MappingProxyType({
+    'pv_config': MappingProxyType({
         'enabled': True, 'min': 1.0, 'max': 5.0, 'step': 1.0,
         'capex': 1000, 'opex': 10, 'lifetime': 25, 'profile': None
-    }
-
-if 'wind_config' not in st.session_state:
-    st.session_state.wind_config = {
+    }),
+    'wind_config': MappingProxyType({
         'enabled': True, 'min': 0.0, 'max': 3.0, 'step': 1.0,
         'capex': 1200, 'opex': 15, 'lifetime': 20, 'profile': None
-    }
-
-if 'hydro_config' not in st.session_state:
-    st.session_state.hydro_config = {
+    }),
+    'hydro_config': MappingProxyType({
         'enabled': True, 'min': 0.0, 'max': 2.0, 'step': 1.0,
         'hours_per_day': 8, 'capex': 2000, 'opex': 20, 'lifetime': 50, 'profile': None
-    }
-
-if 'bess_config' not in st.session_state:
-    st.session_state.bess_config = {
+    }),
+    'bess_config': MappingProxyType({
         'enabled': True, 'min_power': 5.0, 'max_power': 20.0, 'step_power': 5.0,
         'duration': 4.0, 'min_soc': 20, 'max_soc': 100,
         'charge_eff': 95, 'discharge_eff': 95,
         'power_capex': 300, 'energy_capex': 200, 'opex': 2, 'lifetime': 15
-    }
+    }),
+    'selected_component': None,
+    'results': None,
+})
 
-if 'selected_component' not in st.session_state:
+# Saved configs persist on disk only when ENERGY_OPTIMIZER_STORE names a shelf path.
+# Opt-in because the shelf is shared by every session on the server: enable it for
+# single-user (local) runs only.
+_STORE_PATH = os.environ.get('ENERGY_OPTIMIZER_STORE')
+
+@st.cache_resource
+def _persistent_store():
+    """Shelf of saved component configs with its write lock, or None when persistence is off."""
+    if not _STORE_PATH:
+        return None
+    path = os.path.expanduser(_STORE_PATH)
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        return shelve.open(path), threading.Lock()
+    except dbm.error:  # includes OSError: fall back to in-memory session state
+        return None
+
+def _clear_results():
+    """Drop optimization results once an input they were computed from changes."""
+    st.session_state.results = None
+
+def save_config(component, cfg):
+    """Save a component's config to the session and, if enabled, write it through to disk."""
+    key = f'{component}_config'
+    st.session_state[key] = cfg
+    _clear_results()
+    persistent = _persistent_store()
+    if persistent:
+        store, lock = persistent
+        try:
+            with lock:
+                store[key] = cfg
+                store.sync()
+        except (dbm.error, OSError, pickle.PicklingError) as exc:
+            # Keep the in-session value; a toast outlives the rerun that closes the panel
+            st.toast(f"Saved for this session only: could not write the config store ({exc})", icon="⚠️")
+
+# Defaults are read-only; each session gets its own mutable copy of the config dicts,
+# hydrated from disk if enabled (stored values over defaults, so newly added fields still appear)
+for key, value in _SESSION_DEFAULTS.items():
+    if key not in st.session_state:
+        if isinstance(value, MappingProxyType):
+            value = dict(value)
+            persistent = _persistent_store()
+            if persistent:
+                store, lock = persistent
+                with lock:
+                    value.update(store.get(key, {}))
+        st.session_state[key] = value
+
+# Component specs: widget layout and labels for each configuration panel
+COMPONENT_SPECS = {
+    'pv': {
+        'label': 'Solar PV', 'name': 'Solar PV', 'icon': '☀️',
+        'range': ('min', 'max', 50.0, 0.5),
+        'range_labels': ('Minimum (MW)', 'Maximum (MW)'),
+        'range_metrics': ('Min Capacity', 'Max Capacity'),
+        'step': ('step', 'Step Size (MW)', 0.1, 10.0, 0.1),
+        'sliders': [],
+        'inputs': [('capex', 'CapEx ($/kW)', 50), ('opex', 'OpEx ($/kW/yr)', 1),
+                   ('lifetime', 'Lifetime (years)', 1)],
+        'input_columns': 3,
+        'profile': 'Upload PV Profile (1 kW normalized)',
+        'disabled_save': '✅ Save Configuration',
+        'summary': [('Range', '{range}'), ('Step', '{step:.1f} MW'), ('CapEx', '${capex}/kW')],
+    },
+    'wind': {
+        'label': 'Wind', 'name': 'Wind', 'icon': '💨',
+        'range': ('min', 'max', 50.0, 0.5),
+        'range_labels': ('Minimum (MW)', 'Maximum (MW)'),
+        'range_metrics': None,
+        'step': ('step', 'Step (MW)', 0.1, 10.0, 0.1),
+        'sliders': [],
+        'inputs': [('capex', 'CapEx ($/kW)', 1), ('opex', 'OpEx ($/kW/yr)', 1),
+                   ('lifetime', 'Lifetime (yrs)', 1)],
+        'input_columns': 3,
+        'profile': 'Wind Profile',
+        'disabled_save': '✅ Save',
+        'summary': [('Range', '{range}'), ('Step', '{step:.1f} MW')],
+    },
+    'hydro': {
+        'label': 'Hydro', 'name': 'Hydro', 'icon': '💧',
+        'range': ('min', 'max', 30.0, 0.5),
+        'range_labels': ('Min (MW)', 'Max (MW)'),
+        'range_metrics': None,
+        'step': ('step', 'Step (MW)', 0.1, 10.0, 0.1),
+        'sliders': [('hours_per_day', 'Operating Hours/Day', 1, 24, 1)],
+        'inputs': [('capex', 'CapEx ($/kW)', 1), ('opex', 'OpEx ($/kW/yr)', 1),
+                   ('lifetime', 'Lifetime (yrs)', 1)],
+        'input_columns': 3,
+        'profile': 'Hydro Profile (Optional)',
+        'disabled_save': '✅ Save',
+        'summary': [('Range', '{range}'), ('Hours/day', '{hours_per_day}')],
+    },
+    'bess': {
+        'label': 'Battery Storage', 'name': 'BESS', 'icon': '🔋',
+        'range': ('min_power', 'max_power', 100.0, 1.0),
+        'range_labels': ('Min Power (MW)', 'Max Power (MW)'),
+        'range_metrics': None,
+        'step': ('step_power', 'Step (MW)', 0.5, 20.0, 0.5),
+        'sliders': [('duration', 'Duration (hours)', 0.5, 8.0, 0.5)],
+        'inputs': [('power_capex', 'Power CapEx ($/kW)', 1), ('energy_capex', 'Energy CapEx ($/kWh)', 1),
+                   ('opex', 'OpEx ($/kW/yr)', 1), ('lifetime', 'Lifetime (yrs)', 1)],
+        'input_columns': 2,
+        'profile': None,
+        'disabled_save': '✅ Save',
+        'summary': [('Power', '{range}'), ('Duration', '{duration:.1f} hours')],
+    },
+}
+
+def component_configs():
+    """Saved config of every component, keyed and ordered as COMPONENT_SPECS."""
+    return {key: st.session_state[f'{key}_config'] for key in COMPONENT_SPECS}
+
+# Summary cards
+_CARD_MD = '### {icon} {label} ✅\n\n{rows}'
+_CARD_DISABLED_MD = '### {icon} {label} ❌ DISABLED'
+_CARD_ROW_MD = '**{name}:** {value}  \n'
+
+def summary_card(component, caption):
+    """Markdown summarising a component's saved config, for a bordered container."""
+    spec = COMPONENT_SPECS[component]
+    cfg = st.session_state[f'{component}_config']
+    if not cfg['enabled']:
+        return _CARD_DISABLED_MD.format(icon=spec['icon'], label=spec['name'])
+    fields = {**cfg, 'range': caption}
+    # Escape '$' so dollar amounts are not read as LaTeX delimiters
+    rows = ''.join(_CARD_ROW_MD.format(name=name, value=template.format_map(fields).replace('$', r'\$'))
+                   for name, template in spec['summary'])
+    return _CARD_MD.format(icon=spec['icon'], label=spec['name'], rows=rows)
+
+# Search space
+def search_row(component):
+    """The (min, max, step, enabled) capacity axis of a component's saved config."""
+    spec = COMPONENT_SPECS[component]
+    cfg = st.session_state[f'{component}_config']
+    return cfg[spec['range'][0]], cfg[spec['range'][1]], cfg[spec['step'][0]], cfg['enabled']
+
+@st.cache_data(show_spinner=False)
+def capacity_axes(rows):
+    """Capacity grid along each (min, max, step, enabled) row, as float64 arrays."""
+    mins, maxs, steps, _ = np.array(rows, dtype=np.float64).T
+    stepped = steps > 0
+    # Round before flooring so e.g. 0.3 / 0.1 == 2.9999999999999996 still counts 4 options
+    spans = np.round((maxs - mins) / np.where(stepped, steps, 1.0), 6)
+    counts = np.maximum(np.where(stepped, np.floor(spans).astype(np.int64) + 1, 1), 1)
+    return tuple(lo + step * np.arange(count, dtype=np.float64) for lo, step, count in zip(mins, steps, counts))
+
+def search_axes():
+    """Capacity grid of every component's saved config, keyed and ordered as COMPONENT_SPECS."""
+    return dict(zip(COMPONENT_SPECS, capacity_axes(tuple(search_row(key) for key in COMPONENT_SPECS))))
+
+def search_space():
+    """Option count of every component plus the 'total' combinations over enabled ones."""
+    counts = {key: axis.size for key, axis in search_axes().items()}
+    total = math.prod(counts[key] for key, cfg in component_configs().items() if cfg['enabled'])
+    return {**counts, 'total': total}
+
+# Optimization inputs (kernel units: MW, fractions, annualized $/MW)
+def capital_recovery_factor(rate, years):
+    """Share of an upfront cost repaid each year over `years` at discount `rate`."""
+    years = max(years, 1)
+    if rate == 0:
+        return 1.0 / years
+    growth = (1 + rate) ** years
+    return rate * growth / (growth - 1)
+
+def annual_unit_costs(configs, rate):
+    """Annualized cost per MW of PV, wind, hydro and BESS power, in kernel order."""
+    def annualize(capex_per_kw, cfg):
+        return (capex_per_kw * capital_recovery_factor(rate, cfg['lifetime']) + cfg['opex']) * 1000
+
+    bess = configs['bess']
+    return np.array([
+        annualize(configs['pv']['capex'], configs['pv']),
+        annualize(configs['wind']['capex'], configs['wind']),
+        annualize(configs['hydro']['capex'], configs['hydro']),
+        annualize(bess['power_capex'] + bess['energy_capex'] * bess['duration'], bess),
+    ])
+
+def generation_profile(component, cfg, n_hours):
+    """Per-MW hourly output of a component over the load horizon."""
+    if not cfg['enabled']:
+        return np.zeros(n_hours)
+    profile = cfg.get('profile')
+    if profile is None:
+        if component == 'hydro':
+            # No profile: full output for the first hours_per_day hours of each day
+            return (np.arange(n_hours) % 24 < cfg['hours_per_day']).astype(np.float64)
+        raise ValueError(f"Upload a {COMPONENT_SPECS[component]['label']} profile or disable the component")
+    if profile.size < n_hours:
+        raise ValueError(f"{COMPONENT_SPECS[component]['label']} profile has {profile.size:,} values "
+                         f"but the load profile has {n_hours:,}")
+    return profile[:n_hours].astype(np.float64)
+
+def optimization_inputs(load_kw):
+    """Positional arguments of optimizer_kernel.evaluate_grid for the saved configs."""
+    configs = component_configs()
+    axes = search_axes()
+    load = load_kw.astype(np.float64) / 1000
+    bess = configs['bess']
+    return (
+        # Disabled components are evaluated at a single 0 MW point
+        *(axes[key] if configs[key]['enabled'] else np.zeros(1) for key in COMPONENT_SPECS),
+        *(generation_profile(key, configs[key], load.size) for key in ('pv', 'wind', 'hydro')),
+        load,
+        bess['duration'], bess['min_soc'] / 100, bess['max_soc'] / 100,
+        bess['charge_eff'] / 100, bess['discharge_eff'] / 100,
+        annual_unit_costs(configs, st.session_state.discount_rate / 100),
+    )
+
+@st.cache_resource
+def _kernel_lock():
+    """Serializes kernel runs across sessions; numba's workqueue layer is not thread-safe."""
+    return threading.Lock()
+
+# Configuration panel (fragment reruns on its own widget changes)
+def _close_panel():
+    """Point the selector back at the summary; a callback, since the selector owns the key."""
     st.session_state.selected_component = None
 
+def _save_panel(component, enabled):
+    """Save a panel's submitted widget values, read by key, and close the panel."""
+    spec = COMPONENT_SPECS[component]
+    cfg = st.session_state[f'{component}_config']
+    values = {'enabled': enabled}
+    if enabled:
+        fields = (*spec['range'][:2], spec['step'][0],
+                  *(slider[0] for slider in spec['sliders']), *(field[0] for field in spec['inputs']))
+        values.update({field: st.session_state[f'{component}_{field}'] for field in fields})
+        uploaded = st.session_state.get(f'{component}_file')
+        if uploaded is not None:
+            try:
+                values['profile'] = upload_profile(uploaded)
+            except ValueError:
+                return  # save nothing and stay open: the redrawn panel reports the bad profile
+    save_config(component, {**cfg, **values})
+    _close_panel()
+
+@st.fragment
+def render_component_panel():
+    """Render the configuration panel of the selected component from its spec."""
+    # Read the selection here rather than take it as an argument: fragment reruns
+    # replay the first call's arguments, which would pin the first component opened
+    component = st.session_state.selected_component
+    if component is None:
+        # Closed by a Save/Cancel callback: the click only reran this fragment, so an
+        # app-scoped rerun closes the panel and refreshes the topology and sidebar
+        st.rerun()
+
+    spec = COMPONENT_SPECS[component]
+    cfg = st.session_state[f'{component}_config']
+    lo_key, hi_key, range_max, range_inc = spec['range']
+    step_key, step_label, step_min, step_max, step_inc = spec['step']
+    lo_label, hi_label = spec['range_labels']
+
+    st.markdown(f"## {spec['icon']} {spec['label']} Configuration")
+
+    enabled = st.toggle(f"Enable {spec['name']}", value=cfg['enabled'], key=f"{component}_enabled")
+
+    if enabled:
+        st.markdown("### 📊 Capacity Range")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            lo = st.slider(lo_label, 0.0, range_max, cfg[lo_key], range_inc, key=f"{component}_{lo_key}")
+        with col2:
+            hi = st.slider(hi_label, 0.0, range_max, cfg[hi_key], range_inc, key=f"{component}_{hi_key}")
+        with col3:
+            step = st.slider(step_label, step_min, step_max, cfg[step_key], step_inc, key=f"{component}_{step_key}")
+        if spec['range_metrics']:
+            for col, label, value in zip((col1, col2), spec['range_metrics'], (lo, hi)):
+                col.metric(label, f"{value:.1f} MW")
+
+        for field, label, field_min, field_max, field_inc in spec['sliders']:
+            st.slider(label, field_min, field_max, cfg[field], field_inc, key=f"{component}_{field}")
+
+        # Same cached NumPy axis as the sidebar, on the live (unsaved) range
+        num_opts = capacity_axes(((lo, hi, step, True),))[0].size
+        if num_opts <= 10:
+            st.success(f"🟢 {num_opts} configurations - Small search space")
+        elif num_opts <= 50:
+            st.warning(f"🟡 {num_opts} configurations - Medium search space")
+        else:
+            st.error(f"🔴 {num_opts} configurations - Large search space")
+
+        if component == 'bess':
+            st.info(f"💡 Max Energy Capacity: {hi * st.session_state.bess_duration:.1f} MWh")
+
+        # Capacity sliders stay outside the form so the readouts above follow them live;
+        # widgets inside the form only report back when the form is submitted
+        with st.form(f"{component}_form", border=False):
+            st.markdown("### 💰 Financial Parameters")
+            columns = st.columns(spec['input_columns'])
+            per_column = -(-len(spec['inputs']) // len(columns))
+            for index, (field, label, field_inc) in enumerate(spec['inputs']):
+                with columns[index // per_column]:
+                    st.number_input(label, value=cfg[field], step=field_inc, key=f"{component}_{field}")
+
+            if spec['profile']:
+                st.markdown("### 📁 Generation Profile")
+                uploaded = st.file_uploader(spec['profile'], type=['csv', 'xlsx'], key=f"{component}_file")
+                read_profile(uploaded, cfg['profile'])
+
+            # Saving happens in the callbacks, which read every value by key
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.form_submit_button(f"✅ Save {spec['name']} Configuration", type="primary",
+                                      on_click=_save_panel, args=(component, True),
+                                      use_container_width=True)
+            with col2:
+                st.form_submit_button("❌ Cancel", on_click=_close_panel, use_container_width=True)
+    else:
+        st.button(spec['disabled_save'], type="primary", on_click=_save_panel, args=(component, False))
+
 # Header
-st.markdown('<p class="big-font">⚡ ENERGY MODELING OPTIMIZER</p>', unsafe_allow_html=True)
-st.markdown('<p class="subtitle">BY SJ</p>', unsafe_allow_html=True)
-st.markdown("---")
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # Main tabs
 tab1, tab2, tab3 = st.tabs(["🔌 System Design", "⚙️ Optimize", "📊 Results"])
 
-# TAB 1: SYSTEM DESIGN
-with tab1:
-    
+# TAB 1: SYSTEM DESIGN (fragment: selector clicks rerun only this tab; a save reruns the app)
+@st.fragment
+def render_system_design():
+    """Topology, component selector and either the selected panel or the summary."""
     # Visual Topology
     st.markdown("### 🔌 System Architecture")
     
-    pv_cfg = st.session_state.pv_config
-    wind_cfg = st.session_state.wind_config
-    hydro_cfg = st.session_state.hydro_config
-    bess_cfg = st.session_state.bess_config
-    
-    # Simple visual topology
-    st.markdown('<div class="topology-box">', unsafe_allow_html=True)
-    
-    col1, col2, col3, col4, col5 = st.columns([2, 1, 2, 1, 2])
-    
-    with col1:
-        st.markdown('<div style="text-align: center;">', unsafe_allow_html=True)
-        st.markdown('<p class="component-icon">☀️</p>', unsafe_allow_html=True)
-        st.markdown(f"**Solar PV**<br>{'✅ ' + str(pv_cfg['min']) + '-' + str(pv_cfg['max']) + ' MW' if pv_cfg['enabled'] else '❌ Disabled'}", unsafe_allow_html=True)
-        st.markdown('<p class="component-icon">💨</p>', unsafe_allow_html=True)
-        st.markdown(f"**Wind**<br>{'✅ ' + str(wind_cfg['min']) + '-' + str(wind_cfg['max']) + ' MW' if wind_cfg['enabled'] else '❌ Disabled'}", unsafe_allow_html=True)
-        st.markdown('<p class="component-icon">💧</p>', unsafe_allow_html=True)
-        st.markdown(f"**Hydro**<br>{'✅ ' + str(hydro_cfg['min']) + '-' + str(hydro_cfg['max']) + ' MW' if hydro_cfg['enabled'] else '❌ Disabled'}", unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown('<p class="flow-arrow">→</p>', unsafe_allow_html=True)
-        st.markdown('<p class="flow-arrow">→</p>', unsafe_allow_html=True)
-        st.markdown('<p class="flow-arrow">→</p>', unsafe_allow_html=True)
+    configs = component_configs()
     
-    with col3:
-        st.markdown('<div style="text-align: center; padding-top: 80px;">', unsafe_allow_html=True)
-        st.markdown('<p class="component-icon">⚡</p>', unsafe_allow_html=True)
-        st.markdown("**Electricity Grid**<br>Distribution Hub", unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown('<p class="flow-arrow" style="padding-top: 80px;">→</p>', unsafe_allow_html=True)
-        st.markdown('<p class="flow-arrow">↕</p>', unsafe_allow_html=True)
-    
-    with col5:
-        st.markdown('<div style="text-align: center; padding-top: 80px;">', unsafe_allow_html=True)
-        st.markdown('<p class="component-icon">🏭</p>', unsafe_allow_html=True)
-        st.markdown("**Load Demand**<br>Consumer Load", unsafe_allow_html=True)
-        st.markdown('<br><br>', unsafe_allow_html=True)
-        st.markdown('<p class="component-icon">🔋</p>', unsafe_allow_html=True)
-        st.markdown(f"**BESS**<br>{'✅ ' + str(bess_cfg['min_power']) + '-' + str(bess_cfg['max_power']) + ' MW' if bess_cfg['enabled'] else '❌ Disabled'}", unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+    # Capacity captions shared by the topology and the summary cards
+    status = {
+        key: component_status(configs[key], *spec['range'][:2])
+        for key, spec in COMPONENT_SPECS.items()
+    }
     
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Simple visual topology (arguments follow COMPONENT_SPECS order: pv, wind, hydro, bess)
+    st.markdown(topology_svg(*((configs[key]['enabled'], status[key]) for key in COMPONENT_SPECS)),
+                unsafe_allow_html=True)
     
     st.markdown("---")
     
-    # Component buttons
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        if st.button("☀️ Configure Solar PV", use_container_width=True, type="primary"):
-            st.session_state.selected_component = 'pv'
-            st.rerun()
-    
-    with col2:
-        if st.button("💨 Configure Wind", use_container_width=True, type="primary"):
-            st.session_state.selected_component = 'wind'
-            st.rerun()
-    
-    with col3:
-        if st.button("💧 Configure Hydro", use_container_width=True, type="primary"):
-            st.session_state.selected_component = 'hydro'
-            st.rerun()
-    
-    with col4:
-        if st.button("🔋 Configure BESS", use_container_width=True, type="primary"):
-            st.session_state.selected_component = 'bess'
-            st.rerun()
+    # Component selector (one rerun per click; the panel below renders in the same pass)
+    st.radio(
+        "Configure component",
+        [None, *COMPONENT_SPECS],
+        format_func=lambda key: "📋 Summary" if key is None else f"{COMPONENT_SPECS[key]['icon']} {COMPONENT_SPECS[key]['name']}",
+        horizontal=True,
+        key="selected_component",
+    )
     
     st.markdown("---")
     
     # Configuration panels
-    if st.session_state.selected_component == 'pv':
-        st.markdown("## ☀️ Solar PV Configuration")
-        
-        enabled = st.toggle("Enable Solar PV", value=pv_cfg['enabled'])
-        
-        if enabled:
-            st.markdown("### 📊 Capacity Range")
-            col1, col2 = st.columns(2)
-            with col1:
-                min_cap = st.slider("Minimum (MW)", 0.0, 50.0, pv_cfg['min'], 0.5)
-                st.metric("Min Capacity", f"{min_cap:.1f} MW")
-            with col2:
-                max_cap = st.slider("Maximum (MW)", 0.0, 50.0, pv_cfg['max'], 0.5)
-                st.metric("Max Capacity", f"{max_cap:.1f} MW")
-            
-            step = st.slider("Step Size (MW)", 0.1, 10.0, pv_cfg['step'], 0.1)
-            
-            num_opts = int((max_cap - min_cap) / step) + 1 if step > 0 else 1
-            if num_opts <= 10:
-                st.success(f"🟢 {num_opts} configurations - Small search space")
-            elif num_opts <= 50:
-                st.warning(f"🟡 {num_opts} configurations - Medium search space")
-            else:
-                st.error(f"🔴 {num_opts} configurations - Large search space")
-            
-            st.markdown("### 💰 Financial Parameters")
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                capex = st.number_input("CapEx ($/kW)", value=pv_cfg['capex'], step=50)
-            with col2:
-                opex = st.number_input("OpEx ($/kW/yr)", value=pv_cfg['opex'], step=1)
-            with col3:
-                lifetime = st.number_input("Lifetime (years)", value=pv_cfg['lifetime'], step=1)
-            
-            st.markdown("### 📁 Generation Profile")
-            pv_file = st.file_uploader("Upload PV Profile (1 kW normalized)", type=['csv', 'xlsx'], key="pv_file")
-            if pv_file:
-                st.success(f"✅ Loaded: {pv_file.name}")
-            
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                if st.button("✅ Save Solar PV Configuration", type="primary", use_container_width=True):
-                    st.session_state.pv_config = {
-                        'enabled': enabled, 'min': min_cap, 'max': max_cap, 'step': step,
-                        'capex': capex, 'opex': opex, 'lifetime': lifetime, 'profile': pv_file
-                    }
-                    st.success("✅ Solar PV configuration saved!")
-                    st.session_state.selected_component = None
-                    st.rerun()
-            with col2:
-                if st.button("❌ Cancel", use_container_width=True):
-                    st.session_state.selected_component = None
-                    st.rerun()
-        else:
-            if st.button("✅ Save Configuration", type="primary"):
-                st.session_state.pv_config['enabled'] = False
-                st.session_state.selected_component = None
-                st.rerun()
-    
-    elif st.session_state.selected_component == 'wind':
-        st.markdown("## 💨 Wind Configuration")
-        enabled = st.toggle("Enable Wind", value=wind_cfg['enabled'])
-        
-        if enabled:
-            col1, col2 = st.columns(2)
-            with col1:
-                min_cap = st.slider("Minimum (MW)", 0.0, 50.0, wind_cfg['min'], 0.5)
-            with col2:
-                max_cap = st.slider("Maximum (MW)", 0.0, 50.0, wind_cfg['max'], 0.5)
-            
-            step = st.slider("Step (MW)", 0.1, 10.0, wind_cfg['step'], 0.1)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                capex = st.number_input("CapEx ($/kW)", value=wind_cfg['capex'])
-            with col2:
-                opex = st.number_input("OpEx ($/kW/yr)", value=wind_cfg['opex'])
-            with col3:
-                lifetime = st.number_input("Lifetime (yrs)", value=wind_cfg['lifetime'])
-            
-            wind_file = st.file_uploader("Wind Profile", type=['csv', 'xlsx'])
-            
-            if st.button("✅ Save Wind Configuration", type="primary"):
-                st.session_state.wind_config = {
-                    'enabled': enabled, 'min': min_cap, 'max': max_cap, 'step': step,
-                    'capex': capex, 'opex': opex, 'lifetime': lifetime, 'profile': wind_file
-                }
-                st.session_state.selected_component = None
-                st.rerun()
-        else:
-            if st.button("✅ Save", type="primary"):
-                st.session_state.wind_config['enabled'] = False
-                st.session_state.selected_component = None
-                st.rerun()
-    
-    elif st.session_state.selected_component == 'hydro':
-        st.markdown("## 💧 Hydro Configuration")
-        enabled = st.toggle("Enable Hydro", value=hydro_cfg['enabled'])
-        
-        if enabled:
-            col1, col2 = st.columns(2)
-            with col1:
-                min_cap = st.slider("Min (MW)", 0.0, 30.0, hydro_cfg['min'], 0.5)
-            with col2:
-                max_cap = st.slider("Max (MW)", 0.0, 30.0, hydro_cfg['max'], 0.5)
-            
-            step = st.slider("Step (MW)", 0.1, 10.0, hydro_cfg['step'], 0.1)
-            hours = st.slider("Operating Hours/Day", 1, 24, hydro_cfg['hours_per_day'])
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                capex = st.number_input("CapEx ($/kW)", value=hydro_cfg['capex'])
-            with col2:
-                opex = st.number_input("OpEx ($/kW/yr)", value=hydro_cfg['opex'])
-            with col3:
-                lifetime = st.number_input("Lifetime (yrs)", value=hydro_cfg['lifetime'])
-            
-            hydro_file = st.file_uploader("Hydro Profile (Optional)", type=['csv', 'xlsx'])
-            
-            if st.button("✅ Save Hydro Configuration", type="primary"):
-                st.session_state.hydro_config = {
-                    'enabled': enabled, 'min': min_cap, 'max': max_cap, 'step': step,
-                    'hours_per_day': hours, 'capex': capex, 'opex': opex,
-                    'lifetime': lifetime, 'profile': hydro_file
-                }
-                st.session_state.selected_component = None
-                st.rerun()
-        else:
-            if st.button("✅ Save", type="primary"):
-                st.session_state.hydro_config['enabled'] = False
-                st.session_state.selected_component = None
-                st.rerun()
-    
-    elif st.session_state.selected_component == 'bess':
-        st.markdown("## 🔋 Battery Storage Configuration")
-        enabled = st.toggle("Enable BESS", value=bess_cfg['enabled'])
-        
-        if enabled:
-            col1, col2 = st.columns(2)
-            with col1:
-                min_pow = st.slider("Min Power (MW)", 0.0, 100.0, bess_cfg['min_power'], 1.0)
-            with col2:
-                max_pow = st.slider("Max Power (MW)", 0.0, 100.0, bess_cfg['max_power'], 1.0)
-            
-            step_pow = st.slider("Step (MW)", 0.5, 20.0, bess_cfg['step_power'], 0.5)
-            duration = st.slider("Duration (hours)", 0.5, 8.0, bess_cfg['duration'], 0.5)
-            
-            max_energy = max_pow * duration
-            st.info(f"💡 Max Energy Capacity: {max_energy:.1f} MWh")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                power_capex = st.number_input("Power CapEx ($/kW)", value=bess_cfg['power_capex'])
-                energy_capex = st.number_input("Energy CapEx ($/kWh)", value=bess_cfg['energy_capex'])
-            with col2:
-                opex = st.number_input("OpEx ($/kW/yr)", value=bess_cfg['opex'])
-                lifetime = st.number_input("Lifetime (yrs)", value=bess_cfg['lifetime'])
-            
-            if st.button("✅ Save BESS Configuration", type="primary"):
-                st.session_state.bess_config = {
-                    'enabled': enabled, 'min_power': min_pow, 'max_power': max_pow,
-                    'step_power': step_pow, 'duration': duration,
-                    'min_soc': bess_cfg['min_soc'], 'max_soc': bess_cfg['max_soc'],
-                    'charge_eff': bess_cfg['charge_eff'], 'discharge_eff': bess_cfg['discharge_eff'],
-                    'power_capex': power_capex, 'energy_capex': energy_capex,
-                    'opex': opex, 'lifetime': lifetime
-                }
-                st.session_state.selected_component = None
-                st.rerun()
-        else:
-            if st.button("✅ Save", type="primary"):
-                st.session_state.bess_config['enabled'] = False
-                st.session_state.selected_component = None
-                st.rerun()
+    if st.session_state.selected_component in COMPONENT_SPECS:
+        render_component_panel()
     
     else:
         # Summary
         st.markdown("## 📋 Configuration Summary")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if pv_cfg['enabled']:
-                st.markdown('<div class="component-card">', unsafe_allow_html=True)
-                st.markdown("### ☀️ Solar PV ✅")
-                st.write(f"**Range:** {pv_cfg['min']:.1f} - {pv_cfg['max']:.1f} MW")
-                st.write(f"**Step:** {pv_cfg['step']:.1f} MW")
-                st.write(f"**CapEx:** ${pv_cfg['capex']}/kW")
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.markdown('<div class="component-card-disabled">', unsafe_allow_html=True)
-                st.markdown("### ☀️ Solar PV ❌ DISABLED")
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            if hydro_cfg['enabled']:
-                st.markdown('<div class="component-card">', unsafe_allow_html=True)
-                st.markdown("### 💧 Hydro ✅")
-                st.write(f"**Range:** {hydro_cfg['min']:.1f} - {hydro_cfg['max']:.1f} MW")
-                st.write(f"**Hours/day:** {hydro_cfg['hours_per_day']}")
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.markdown('<div class="component-card-disabled">', unsafe_allow_html=True)
-                st.markdown("### 💧 Hydro ❌ DISABLED")
-                st.markdown('</div>', unsafe_allow_html=True)
-        
-        with col2:
-            if wind_cfg['enabled']:
-                st.markdown('<div class="component-card">', unsafe_allow_html=True)
-                st.markdown("### 💨 Wind ✅")
-                st.write(f"**Range:** {wind_cfg['min']:.1f} - {wind_cfg['max']:.1f} MW")
-                st.write(f"**Step:** {wind_cfg['step']:.1f} MW")
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.markdown('<div class="component-card-disabled">', unsafe_allow_html=True)
-                st.markdown("### 💨 Wind ❌ DISABLED")
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            if bess_cfg['enabled']:
-                st.markdown('<div class="component-card">', unsafe_allow_html=True)
-                st.markdown("### 🔋 BESS ✅")
-                st.write(f"**Power:** {bess_cfg['min_power']:.1f} - {bess_cfg['max_power']:.1f} MW")
-                st.write(f"**Duration:** {bess_cfg['duration']:.1f} hours")
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.markdown('<div class="component-card-disabled">', unsafe_allow_html=True)
-                st.markdown("### 🔋 BESS ❌ DISABLED")
-                st.markdown('</div>', unsafe_allow_html=True)
+        for col, keys in zip(st.columns(2), (('pv', 'hydro'), ('wind', 'bess'))):
+            with col:
+                for key in keys:
+                    with st.container(border=True):
+                        st.markdown(summary_card(key, status[key]))
 
-with tab2:
+with tab1:
+    render_system_design()
+
+# TAB 2: OPTIMIZE
+@st.fragment
+def render_optimize():
+    """Optimization controls."""
     st.header("⚙️ Run Optimization")
-    st.info("🚧 Optimization engine integration coming next")
+    st.markdown(f"**{search_space()['total']:,}** capacity combinations to evaluate")
 
-with tab3:
+    load_file = st.session_state.get("load_file")
+    if load_file is None:
+        st.info("ℹ️ Upload a load profile in the sidebar to run the optimization.")
+        return
+
+    if st.button("🚀 Run Optimization", type="primary"):
+        try:
+            inputs = optimization_inputs(upload_profile(load_file))
+        except ValueError as exc:
+            st.error(f"❌ {exc}")
+            return
+        from optimizer_kernel import evaluate_grid  # numba import and JIT load only when first run
+
+        with st.spinner("Evaluating capacity combinations..."), _kernel_lock():
+            st.session_state.results = evaluate_grid(*inputs)
+        # App-scoped so the Results tab picks up the new run
+        st.rerun()
+
+with tab2:
+    render_optimize()
+
+# TAB 3: RESULTS
+@st.fragment
+def render_results():
+    """Optimization results."""
     st.header("📊 Results")
-    st.info("ℹ️ No results yet. Run optimization first.")
+    results = st.session_state.results
+    if results is None:
+        st.info("ℹ️ No results yet. Run optimization first.")
+        return
+
+    import pandas as pd
+    from optimizer_kernel import RESULT_COLUMNS
+
+    frame = pd.DataFrame(results, columns=RESULT_COLUMNS)
+    feasible = frame[frame['unmet_frac'] <= st.session_state.target_unmet / 100]
+    if feasible.empty:
+        st.warning(f"⚠️ None of the {len(frame):,} combinations meets the unmet load target.")
+        return
+
+    ranked = feasible.nsmallest(20, 'lcoe')
+    best = ranked.iloc[0]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Best LCOE", f"${best['lcoe']:,.2f}/MWh")
+    col2.metric("Unmet Load", f"{best['unmet_frac'] * 100:.2f}%")
+    col3.metric("Feasible Combinations", f"{len(feasible):,} / {len(frame):,}")
+    st.dataframe(ranked, hide_index=True, use_container_width=True)
+
+with tab3:
+    render_results()
 
 # Sidebar
+@st.fragment
+def render_financial_settings():
+    """Financial inputs nothing else renders from; edits rerun only this block."""
+    st.number_input("Inflation Rate (%)", value=2.0, step=0.5, key="inflation_rate")
+    st.number_input("Project Lifetime (years)", value=25, step=1, key="project_lifetime")
+
 with st.sidebar:
     st.markdown("### ⚙️ Global Settings")
     
     st.markdown("#### 💰 Financial Parameters")
-    discount_rate = st.number_input("Discount Rate (%)", value=8.0, step=0.5)
-    inflation_rate = st.number_input("Inflation Rate (%)", value=2.0, step=0.5)
-    project_lifetime = st.number_input("Project Lifetime (years)", value=25, step=1)
+    # Outside the fragment like the inputs below: the optimizer reads it, so an edit
+    # reruns the app and drops results computed at the old rate
+    st.number_input("Discount Rate (%)", value=8.0, step=0.5, key="discount_rate", on_change=_clear_results)
+    render_financial_settings()
     
     st.markdown("---")
     st.markdown("#### 🏭 Load Profile & Constraints")
     
-    load_file = st.file_uploader("📁 Load Profile (kW)", type=['csv', 'xlsx'])
+    # Outside the fragment: the Optimize and Results tabs render from these, so edits rerun the app
+    load_file = st.file_uploader("📁 Load Profile (kW)", type=['csv', 'xlsx'], key="load_file",
+                                 on_change=_clear_results)
     if load_file:
-        st.success(f"✅ Loaded: {load_file.name}")
+        read_profile(load_file)
     
-    target_unmet = st.number_input("Target Unmet Load (%)", value=0.1, step=0.1)
+    st.number_input("Target Unmet Load (%)", value=0.1, step=0.1, key="target_unmet")
     
     st.markdown("---")
     st.markdown("### 📊 Search Space")
     
-    pv_opts = int((pv_cfg['max'] - pv_cfg['min']) / pv_cfg['step']) + 1 if pv_cfg['enabled'] and pv_cfg['step'] > 0 else 1
-    wind_opts = int((wind_cfg['max'] - wind_cfg['min']) / wind_cfg['step']) + 1 if wind_cfg['enabled'] and wind_cfg['step'] > 0 else 1
-    hydro_opts = int((hydro_cfg['max'] - hydro_cfg['min']) / hydro_cfg['step']) + 1 if hydro_cfg['enabled'] and hydro_cfg['step'] > 0 else 1
-    bess_opts = int((bess_cfg['max_power'] - bess_cfg['min_power']) / bess_cfg['step_power']) + 1 if bess_cfg['enabled'] and bess_cfg['step_power'] > 0 else 1
-    
-    total = pv_opts * wind_opts * hydro_opts * bess_opts
+    total = search_space()['total']
     
     st.metric("Total Combinations", f"{total:,}")
     st.metric("Est. Runtime", f"{max(1, total * 0.05 / 60):.1f} min")
 
 st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #00D9FF; padding: 20px;">
-    <p style="font-size: 18px;"><b>⚡ Energy Modeling Optimizer v4.0 Professional</b></p>
-    <p style="font-size: 14px;">Developed by SJ | 2026</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
@@ -0,0 +1,84 @@
+"""
+OPTIMIZATION KERNEL
+===================
+Hourly dispatch and LCOE evaluation over the capacity search grid.
+
+All capacities are in MW, generation profiles are normalized per unit of
+installed capacity and the load profile is in MW.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Result columns returned by evaluate_grid
+RESULT_COLUMNS = ('pv_mw', 'wind_mw', 'hydro_mw', 'bess_mw', 'unmet_frac', 'lcoe')
+
+
+@njit(parallel=True, cache=True)
+def evaluate_grid(pv_caps, wind_caps, hydro_caps, bess_powers,
+                  pv_profile, wind_profile, hydro_profile, load,
+                  bess_duration, min_soc, max_soc, charge_eff, discharge_eff,
+                  unit_costs):
+    """
+    Dispatch every capacity combination hour by hour.
+
+    unit_costs holds the annualized cost per MW of PV, wind, hydro and BESS
+    power (BESS energy cost folded in for the configured duration). Returns an
+    (N, 6) array laid out as RESULT_COLUMNS.
+    """
+    n_pv = pv_caps.shape[0]
+    n_wind = wind_caps.shape[0]
+    n_hydro = hydro_caps.shape[0]
+    n_bess = bess_powers.shape[0]
+    n_total = n_pv * n_wind * n_hydro * n_bess
+    n_hours = load.shape[0]
+
+    total_load = 0.0
+    for t in range(n_hours):
+        total_load += load[t]
+    year_scale = 8760.0 / n_hours
+
+    results = np.empty((n_total, 6))
+
+    for idx in prange(n_total):
+        i_bess = idx % n_bess
+        rest = idx // n_bess
+        i_hydro = rest % n_hydro
+        rest = rest // n_hydro
+        i_wind = rest % n_wind
+        i_pv = rest // n_wind
+
+        pv = pv_caps[i_pv]
+        wind = wind_caps[i_wind]
+        hydro = hydro_caps[i_hydro]
+        power = bess_powers[i_bess]
+
+        energy = power * bess_duration
+        soc_lo = energy * min_soc
+        soc_hi = energy * max_soc
+        soc = soc_hi
+        unmet = 0.0
+
+        for t in range(n_hours):
+            net = pv * pv_profile[t] + wind * wind_profile[t] + hydro * hydro_profile[t] - load[t]
+            if net >= 0.0:
+                charge = min(net, power, (soc_hi - soc) / charge_eff)
+                soc += charge * charge_eff
+            else:
+                deficit = -net
+                discharge = min(deficit, power, (soc - soc_lo) * discharge_eff)
+                soc -= discharge / discharge_eff
+                unmet += deficit - discharge
+
+        annual_cost = (pv * unit_costs[0] + wind * unit_costs[1]
+                       + hydro * unit_costs[2] + power * unit_costs[3])
+        served = (total_load - unmet) * year_scale
+
+        results[idx, 0] = pv
+        results[idx, 1] = wind
+        results[idx, 2] = hydro
+        results[idx, 3] = power
+        results[idx, 4] = unmet / total_load if total_load > 0.0 else 0.0
+        results[idx, 5] = annual_cost / served if served > 0.0 else np.inf
+
+    return results